@@ -1,6 +1,15 @@
 from abc import ABC, abstractmethod
+import asyncio
+import math
+import threading
+import time
+import httpx
+import orjson
 import requests
 import logging
+import urllib.parse
+from collections import OrderedDict
+from types import MappingProxyType
 from typing import Optional, Dict, Any, List
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -9,6 +18,14 @@ from urllib3.util.retry import Retry
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Brotli сжимает ответы API заметно лучше gzip, но требует отдельной
+# библиотеки для декодирования — объявляем его только если она доступна
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
 
 class ParserError(Exception):
     """Базовое исключение для парсеров"""
@@ -47,16 +64,36 @@ class HH(Parser):
     VACANCIES_ENDPOINT = "/vacancies"
     DEFAULT_PER_PAGE = 100
     MAX_PAGES = 20  # HH API ограничение
-
-    def __init__(self, timeout: int = 10, max_retries: int = 3):
+    MAX_CONCURRENT_REQUESTS = 5  # Ограничение параллелизма (rate limit HH)
+    POOL_SIZE = 20  # Размер пула keep-alive соединений
+    # Статусы, при которых запрос страницы повторяется — тот же список,
+    # что и в status_forcelist retry-стратегии синхронной сессии
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    RATE_LIMIT_THRESHOLD = 3  # Порог остатка квоты, после которого притормаживаем
+
+    # Неизменяемая заготовка параметров запроса; MappingProxyType защищает
+    # её от случайной мутации между вызовами
+    BASE_PARAMS = MappingProxyType({"per_page": DEFAULT_PER_PAGE, "page": 0})
+    CACHE_MAXSIZE = 256  # Максимум закэшированных страниц
+    CACHE_TTL = 300  # Время жизни записи кэша в секундах
+
+    def __init__(self, timeout: int = 10, max_retries: int = 3, prewarm: bool = True):
         """ Инициализация парсера HH
         Args: timeout: Таймаут запросов в секундах
-              max_retries: Максимальное количество повторных попыток"""
+              max_retries: Максимальное количество повторных попыток
+              prewarm: Прогревать ли соединение фоновым запросом —
+                  в тестах и скриптах без сети стоит отключить"""
         self._session: Optional[requests.Session] = None
         self._url = f"{self.BASE_URL}{self.VACANCIES_ENDPOINT}"
-        self._headers = {"User-Agent": "VacancyParser"}
+        self._headers = {
+            "User-Agent": "VacancyParser",
+            "Accept-Encoding": ACCEPT_ENCODING,
+            "Connection": "keep-alive"
+        }
         self._timeout = timeout
         self._max_retries = max_retries
+        self._prewarm = prewarm
+        self._page_cache: OrderedDict = OrderedDict()
         self._setup_session()
 
     def _setup_session(self) -> None:
@@ -69,11 +106,105 @@ class HH(Parser):
             backoff_factor=1
         )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Увеличенный пул + keep-alive: повторные запросы переиспользуют
+        # уже установленное TLS-соединение вместо нового handshake
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=self.POOL_SIZE,
+            pool_maxsize=self.POOL_SIZE,
+            pool_block=False
+        )
         self._session.mount("http://", adapter)
         self._session.mount("https://", adapter)
         self._session.headers.update(self._headers)
 
+        # Спекулятивный прогрев: DNS, TCP и TLS handshake выполняются в
+        # фоне (например, пока пользователь вводит параметры поиска),
+        # и первый настоящий запрос получает уже тёплое соединение
+        if self._prewarm:
+            threading.Thread(target=self._prewarm_connection, daemon=True).start()
+
+    def _prewarm_connection(self) -> None:
+        """Фоновый HEAD-запрос, заполняющий DNS-кэш и пул соединений"""
+        try:
+            self._session.head(self._url, timeout=self._timeout)
+        except requests.exceptions.RequestException:
+            # Прогрев — чистая оптимизация, его ошибки не важны:
+            # реальный запрос сообщит о проблеме сам
+            pass
+
+    def _rate_limit_delay(self, headers) -> float:
+        """ Пауза (в секундах) по заголовкам квоты запросов
+        Когда X-RateLimit-Remaining почти исчерпан, оставшиеся запросы
+        размазываются до X-RateLimit-Reset — это дешевле, чем получить
+        429 и платить секундный backoff retry-стратегии
+        Args: headers: Заголовки HTTP-ответа
+        Returns: float: Сколько секунд подождать перед следующим запросом """
+        try:
+            remaining = int(headers.get("X-RateLimit-Remaining"))
+            reset = float(headers.get("X-RateLimit-Reset"))
+        except (TypeError, ValueError):
+            # Заголовков нет — ведём себя как раньше
+            return 0.0
+
+        until_reset = max(0.0, reset - time.time())
+        if remaining <= 0:
+            return until_reset
+        if remaining < self.RATE_LIMIT_THRESHOLD:
+            return until_reset / remaining
+        return 0.0
+
+    @staticmethod
+    def _slim_item(item: Dict[str, Any]) -> Dict[str, Any]:
+        """ Проекция вакансии HH на реально используемые поля
+        Полный ответ несёт логотипы, адреса и прочие метаданные — в разы
+        больше байт, чем нужно дальше по конвейеру (Vacancy.from_hh_dict) """
+        return {
+            "id": item.get("id"),
+            "name": item.get("name"),
+            "alternate_url": item.get("alternate_url"),
+            "salary": item.get("salary"),
+            "snippet": item.get("snippet"),
+        }
+
+    def _async_transport(self) -> httpx.AsyncHTTPTransport:
+        """ Транспорт для параллельной загрузки страниц
+        retries повторяет неудачные попытки соединения — асинхронный путь
+        получает ту же устойчивость к обрывам, что и синхронная сессия """
+        return httpx.AsyncHTTPTransport(http2=True, retries=self._max_retries)
+
+    @staticmethod
+    def _cache_key(params: Dict[str, Any]) -> tuple:
+        """Канонический ключ кэша из параметров запроса"""
+        return tuple(sorted(params.items()))
+
+    def _cache_get(self, key: tuple) -> Optional[Dict[str, Any]]:
+        """ Получить ответ API из кэша
+        Args: key: Ключ, построенный через _cache_key
+        Returns: Optional[Dict[str, Any]]: Данные страницы или None,
+                 если записи нет либо она устарела """
+        entry = self._page_cache.get(key)
+        if entry is None:
+            return None
+
+        saved_at, data = entry
+        if time.monotonic() - saved_at > self.CACHE_TTL:
+            del self._page_cache[key]
+            return None
+
+        # Обновляем позицию записи (LRU)
+        self._page_cache.move_to_end(key)
+        return data
+
+    def _cache_put(self, key: tuple, data: Dict[str, Any]) -> None:
+        """ Сохранить ответ API в кэш, вытесняя самые старые записи
+        Args: key: Ключ, построенный через _cache_key
+              data: Распарсенный ответ API """
+        self._page_cache[key] = (time.monotonic(), data)
+        self._page_cache.move_to_end(key)
+        while len(self._page_cache) > self.CACHE_MAXSIZE:
+            self._page_cache.popitem(last=False)
+
     def connect(self) -> bool:
         """ Проверка подключения к API HeadHunter
         Returns: bool: True если подключение успешно
@@ -95,7 +226,7 @@ class HH(Parser):
 
     def load_vacancies(
             self,
-            keyword: str,
+            keyword: str | List[str],
             per_page: int = DEFAULT_PER_PAGE,
             max_pages: Optional[int] = None,
             area: Optional[int] = None,
@@ -103,7 +234,8 @@ class HH(Parser):
             salary_to: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """ Загрузка вакансий с HeadHunter
-        Args: keyword: Ключевое слово для поиска
+        Args: keyword: Ключевое слово для поиска либо список слов —
+                  список объединяется оператором OR и уходит одним запросом
               max_pages: Максимальное количество страниц (по умолчанию 2)
               per_page: Количество вакансий на странице (по умолчанию 100)
               area: ID региона (113 Россия,1 Москва)
@@ -114,6 +246,11 @@ class HH(Parser):
         Raises: ValueError: При пустом ключевом слове
                 ConnectionError: Не удалось подключиться к API"""
 
+        # Несколько ключевых слов объединяем синтаксисом OR языка запросов
+        # HH — одна пачка запросов вместо отдельной серии на каждое слово
+        if isinstance(keyword, (list, tuple)):
+            keyword = " OR ".join(word.strip() for word in keyword if word.strip())
+
         # Проверяем ключевое слово
         if not keyword.strip():
             raise ValueError("Ключевое слово не может быть пустым")
@@ -123,12 +260,15 @@ class HH(Parser):
             max_pages = 2
         max_pages = min(max_pages, self.MAX_PAGES)
 
+        # RTT одинаковый независимо от размера страницы, поэтому всегда
+        # запрашиваем максимум вакансий на страницу, а лишнее отрезаем
+        # перед возвратом — так нужно меньше запросов
+        per_page = min(per_page, self.DEFAULT_PER_PAGE)
+        requested_total = per_page * max_pages
+        max_pages = math.ceil(requested_total / self.DEFAULT_PER_PAGE)
+
         # Подготовка параметров для HTTP-запроса к API HeadHunter
-        params = {
-            "text": keyword.strip(),
-            "per_page": min(per_page, self.DEFAULT_PER_PAGE),
-            "page": 0
-        }
+        params = {**self.BASE_PARAMS, "text": keyword.strip()}
 
         # Добавляем дополнительные параметры если они указаны
         if area is not None:
@@ -146,47 +286,77 @@ class HH(Parser):
 
         logger.info(f"Параметры HTTP - запроса к API HeadHunter - {params}")
 
-        # Проверяем подключение
-        self.connect()
-
         vacancies = []
 
         try:
-            for page in range(max_pages):
-                params["page"] = page
-                logger.info(f"Загрузка страницы {page + 1} из {max_pages}")
-
-                response = self._session.get(
-                    self._url,
-                    params=params,
-                    timeout=self._timeout
-                )
+            # Первая страница запрашивается синхронно через сессию с retry:
+            # из её ответа узнаем реальное количество страниц.
+            # Отдельный pre-flight через connect() не нужен — этот же запрос
+            # выполняет роль проверки подключения
+            cache_key = self._cache_key(params)
+            data = self._cache_get(cache_key)
+            if data is None:
+                logger.info(f"Загрузка страницы 1 из {max_pages}")
+                try:
+                    response = self._session.get(
+                        self._url,
+                        params=params,
+                        timeout=self._timeout
+                    )
+                except requests.exceptions.ConnectionError as e:
+                    logger.error(f"Ошибка подключения к API HeadHunter: {e}")
+                    raise ConnectionError(f"Не удалось подключиться к API: {e}")
 
                 # Проверяем код HTTP ответа
                 response.raise_for_status()
 
-                # Преобразуем (парсим) JSON - строку из ответа в список словарей
-                data = response.json()
-
-                # Безопасно извлекаем список вакансий по ключу "items"
-                # Если API вернет неожиданную структуру без "items",
-                # получим пустой список вместо ошибки
-                items = data.get("items", [])
-
-                # Проверяем есть ли в ответе нет "items", если нет прерываем цикл
-                if not items:
-                    logger.info(f"Вакансий на странице {page + 1} не найдено")
-                    break
-
-                # Проверяем есть ли в ответе нет "items", если нет прерываем цикл
-                vacancies.extend(items)
-                logger.info(f"Загружено {len(items)} вакансий со страницы {page + 1}")
+                delay = self._rate_limit_delay(response.headers)
+                if delay > 0:
+                    logger.info(f"Квота запросов почти исчерпана, пауза {delay:.2f} с")
+                    time.sleep(delay)
+
+                # Преобразуем (парсим) JSON из ответа; orjson работает с
+                # байтами напрямую, без промежуточной строки. Его
+                # JSONDecodeError — это ValueError, а не RequestException,
+                # поэтому битый ответ заворачиваем в ParserError явно
+                try:
+                    data = orjson.loads(response.content)
+                except orjson.JSONDecodeError as e:
+                    logger.error(f"Некорректный JSON в ответе API: {e}")
+                    raise ParserError(f"Ошибка при получении данных: {e}")
+                data["items"] = [self._slim_item(item) for item in data.get("items", [])]
+                self._cache_put(cache_key, data)
+            else:
+                logger.info("Страница 1 взята из кэша")
+
+            # Безопасно извлекаем список вакансий по ключу "items"
+            # Если API вернет неожиданную структуру без "items",
+            # получим пустой список вместо ошибки
+            items = data.get("items", [])
+
+            if not items:
+                logger.info("Вакансий на первой странице не найдено")
+                return vacancies
+
+            vacancies.extend(items)
+            logger.info(f"Загружено {len(items)} вакансий со страницы 1")
+
+            # Остальные страницы загружаем параллельно: суммарное время
+            # примерно равно одному round-trip вместо max_pages round-trip'ов.
+            # Количество страниц зажимаем по "pages" и "found" из первого
+            # ответа, чтобы не запрашивать заведомо пустые страницы
+            total_pages = data.get("pages", 0)
+            found = data.get("found")
+            if found is not None:
+                total_pages = min(total_pages, math.ceil(found / self.DEFAULT_PER_PAGE))
+            last_page = min(max_pages, total_pages)
+            if last_page > 1:
+                vacancies.extend(
+                    asyncio.run(self._afetch_pages(params, range(1, last_page)))
+                )
 
-                # Проверяем, есть ли еще страницы
-                total_pages = data.get("pages", 0)
-                if page >= total_pages - 1:
-                    logger.info(f"Достигнута последняя страница ({total_pages})")
-                    break
+            # Отрезаем лишнее, если пользователь просил меньше, чем вернули страницы
+            vacancies = vacancies[:requested_total]
 
             logger.info(f"Загружено {len(vacancies)} вакансий по запросу '{keyword}'")
             return vacancies
@@ -195,6 +365,82 @@ class HH(Parser):
             logger.error(f"Ошибка при загрузке вакансий: {e}")
             raise ParserError(f"Ошибка при получении данных: {e}")
 
+    async def _afetch_pages(self, params: Dict[str, Any], pages: range) -> List[Dict[str, Any]]:
+        """ Параллельная загрузка страниц через httpx с HTTP/2
+        Каждая задача парсит свой ответ сразу по получении, поэтому разбор
+        JSON одной страницы перекрывается ожиданием сети остальных —
+        отдельный конвейер "грузим N+1, пока разбираем N" не нужен
+        Args: params: Базовые параметры запроса
+              pages: Номера страниц для загрузки
+        Returns: List[Dict[str, Any]]: Вакансии со всех страниц в порядке страниц
+        Raises: ParserError: При ошибке получения данных """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+
+        # Статическая часть query string кодируется один раз; на каждую
+        # страницу остаётся только дописать её номер
+        base_qs = urllib.parse.urlencode(
+            {key: value for key, value in params.items() if key != "page"}
+        )
+        base_url = f"{self._url}?{base_qs}&page="
+
+        async def fetch_page(client: httpx.AsyncClient, page: int) -> List[Dict[str, Any]]:
+            page_params = {**params, "page": page}
+            cache_key = self._cache_key(page_params)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                logger.info(f"Страница {page + 1} взята из кэша")
+                return cached.get("items", [])
+
+            async with semaphore:
+                logger.info(f"Загрузка страницы {page + 1}")
+                # Транзиентные статусы (429/5xx) повторяем с экспоненциальным
+                # backoff — как Retry(backoff_factor=1) у синхронной сессии
+                for attempt in range(self._max_retries + 1):
+                    response = await client.get(f"{base_url}{page}")
+                    if response.status_code in self.RETRY_STATUSES and attempt < self._max_retries:
+                        backoff = 2 ** attempt
+                        logger.info(
+                            f"Статус {response.status_code} на странице {page + 1}, "
+                            f"повтор через {backoff} с"
+                        )
+                        await asyncio.sleep(backoff)
+                        continue
+                    break
+                response.raise_for_status()
+
+                delay = self._rate_limit_delay(response.headers)
+                if delay > 0:
+                    logger.info(f"Квота запросов почти исчерпана, пауза {delay:.2f} с")
+                    await asyncio.sleep(delay)
+
+                # Битый ответ — ParserError, как и в синхронном пути:
+                # голый JSONDecodeError прошёл бы мимо except httpx.HTTPError
+                try:
+                    data = orjson.loads(response.content)
+                except orjson.JSONDecodeError as e:
+                    logger.error(f"Некорректный JSON в ответе API: {e}")
+                    raise ParserError(f"Ошибка при получении данных: {e}")
+                data["items"] = [self._slim_item(item) for item in data.get("items", [])]
+                self._cache_put(cache_key, data)
+                items = data["items"]
+                logger.info(f"Загружено {len(items)} вакансий со страницы {page + 1}")
+                return items
+
+        try:
+            # HTTP/2 мультиплексирует все запросы по одному соединению —
+            # без затрат на установку TCP/TLS для каждой страницы
+            async with httpx.AsyncClient(
+                transport=self._async_transport(),
+                headers=self._headers,
+                timeout=self._timeout
+            ) as client:
+                results = await asyncio.gather(*(fetch_page(client, page) for page in pages))
+            return [item for items in results for item in items]
+
+        except httpx.HTTPError as e:
+            logger.error(f"Ошибка при параллельной загрузке вакансий: {e}")
+            raise ParserError(f"Ошибка при получении данных: {e}")
+
     def __enter__(self):
         """Поддержка контекстного менеджера"""
         return self
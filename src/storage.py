@@ -1,8 +1,10 @@
+import bisect
 import os
-import json
+import re
+import ijson
+import orjson
 from abc import ABC, abstractmethod
-from enum import unique
-from typing import List
+from typing import Iterable, Iterator, List
 from src.vacancy import Vacancy
 
 
@@ -41,6 +43,70 @@ class Storage(ABC):
         pass
 
 
+def _dedup_key(item: dict) -> bytes:
+    """
+    Ключ дедупликации вакансии. Производное поле avg_salary исключается,
+    чтобы записи, сохранённые до его появления, не считались новыми.
+    """
+    if 'avg_salary' in item:
+        item = {k: v for k, v in item.items() if k != 'avg_salary'}
+    return orjson.dumps(item, option=orjson.OPT_SORT_KEYS)
+
+
+def _item_avg_salary(item: dict) -> float:
+    """
+    Средняя зарплата по сырому словарю вакансии (без создания объекта).
+    Повторяет логику Vacancy.avg_salary.
+    """
+    salary_from = item.get('salary_from') or 0
+    salary_to = item.get('salary_to') or 0
+    if salary_from > 0 and salary_to > 0:
+        return (salary_from + salary_to) / 2
+    elif salary_from > 0:
+        return float(salary_from)
+    elif salary_to > 0:
+        return float(salary_to)
+    return 0
+
+
+def _iter_filtered(data: Iterable[dict], criteria: dict) -> Iterator[Vacancy]:
+    """
+    Генератор объектов Vacancy из словарей с фильтрацией по критериям.
+    Сырые словари фильтруются до создания объектов, а сами объекты
+    строятся лениво — потребитель, которому нужны первые N вакансий,
+    не оплачивает конструирование остальных.
+    :param data: Итерируемые словари с данными вакансий.
+    :param criteria: keyword: ключевое слово, min_salary: минимальная зарплата.
+    :return: Итератор подходящих объектов Vacancy.
+    """
+    pattern = None
+    if 'keyword' in criteria:
+        # Один скомпилированный регистронезависимый паттерн вместо пары
+        # .lower() и сканов подстроки на каждую вакансию; список ключевых
+        # слов объединяется через "или"
+        keywords = criteria['keyword']
+        if isinstance(keywords, str):
+            keywords = [keywords]
+        pattern = re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+
+    min_sal = criteria['min_salary'] if 'min_salary' in criteria else None
+
+    for item in data:
+        if pattern is not None:
+            # Один проход C-движка по склейке полей вместо двух вызовов;
+            # casefold-копии строк при этом не создаются вовсе
+            blob = f"{item.get('title', '')}\n{item.get('description', '')}"
+            if not pattern.search(blob):
+                continue
+        if min_sal is not None:
+            avg = item.get('avg_salary')
+            if avg is None:
+                avg = _item_avg_salary(item)
+            if avg < min_sal:
+                continue
+        yield Vacancy(**item)
+
+
 class JSONStorage(Storage):
     """Класс, реализующий хранилище вакансий в JSON-файле."""
 
@@ -51,19 +117,43 @@ class JSONStorage(Storage):
         """
         base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         self.__filename = filename or os.path.join(base_dir, "data", "vacancies.json")
+        # Кэш содержимого файла: (mtime файла, список сырых словарей) —
+        # в рамках сессии файл меняется только через это же хранилище
+        self.__data_cache = None
+        # Индекс по средней зарплате: (mtime файла, словари по возрастанию
+        # avg_salary, список самих зарплат для bisect)
+        self.__salary_index = None
+
+    @property
+    def filename(self) -> str:
+        """Путь к JSON-файлу хранилища"""
+        return self.__filename
 
     def add_vacancies(self, vacancies: List[Vacancy]) -> None:
         """
-        Получить список вакансий с возможной фильтрацией по ключевым словам и зарплате.
-        :param criteria: keyword: ключевое слово, min_salary: минимальная зарплата.
-        :return: Отфильтрованный список объектов Vacancy.
+        Добавить вакансии в хранилище, пропуская дубликаты.
+        :param vacancies: Список объектов Vacancy для сохранения.
         """
-        existing = self._load_from_file()
-        existing_set = {json.dump(item, sort_keys=True) for item in existing}
-        new_data = [v.to_dict() for v in vacancies]
-        unique_new_data = [item for item in new_data if json.dump(item, sort_keys=True) not in existing_set]
-        existing.extend(unique_new_data)
-        self._save_to_file(existing)
+        # Копия кэшированных данных: кэш не мутируем до успешной записи
+        existing = list(self._cached_data())
+        # Канонический ключ — сериализованный словарь с сортировкой ключей,
+        # поиск по множеству даёт O(1) на каждую новую вакансию
+        existing_keys = {_dedup_key(item) for item in existing}
+        added = False
+        for vacancy in vacancies:
+            item = vacancy.to_dict()
+            key = _dedup_key(item)
+            if key not in existing_keys:
+                existing_keys.add(key)
+                # Средняя зарплата считается один раз при сохранении,
+                # фильтрам по зарплате не приходится выводить её заново
+                item['avg_salary'] = vacancy.avg_salary
+                existing.append(item)
+                added = True
+        # Батч из одних дубликатов не переписывает файл целиком
+        if added:
+            self._save_to_file(existing)
+            self.__data_cache = (self._file_mtime(), existing)
 
     def get_vacancies(self, **criteria) -> List[Vacancy]:
         """
@@ -71,21 +161,57 @@ class JSONStorage(Storage):
         :param criteria: keyword: ключевое слово, min_salary: минимальная зарплата.
         :return: Отфильтрованный список объектов Vacancy.
         """
-        data = self._load_from_file()
-        vacancies = [Vacancy(**item) for item in data]
+        if set(criteria) == {'min_salary'}:
+            # Чистый зарплатный фильтр отвечает по индексу за O(log N)
+            # вместо линейного скана; результат отсортирован по зарплате
+            items, salaries = self._salary_sorted_items()
+            start = bisect.bisect_left(salaries, criteria['min_salary'])
+            return [Vacancy(**item) for item in items[start:]]
+        return list(self.iter_vacancies(**criteria))
+
+    def iter_vacancies(self, **criteria) -> Iterator[Vacancy]:
+        """
+        Ленивый аналог get_vacancies: вакансии читаются из файла и
+        конструируются по мере обхода итератора.
+        :param criteria: keyword: ключевое слово, min_salary: минимальная зарплата.
+        :return: Итератор подходящих объектов Vacancy.
+        """
+        return _iter_filtered(self._cached_data(), criteria)
+
+    def _file_mtime(self):
+        """mtime файла хранилища или None, если файла нет"""
+        try:
+            return os.path.getmtime(self.__filename)
+        except OSError:
+            return None
 
-        # Фильтрация
-        if 'keyword' in criteria:
-            keyword = criteria['keyword'].lower()
-            vacancies = [v for v in vacancies if
-                         keyword in v.title.lower() or
-                         keyword in v.description.lower()]
+    def _cached_data(self) -> List[dict]:
+        """
+        Сырые словари вакансий с кэшированием в памяти: файл перечитывается
+        и парсится заново только если его mtime изменился.
+        """
+        mtime = self._file_mtime()
+        if self.__data_cache is None or self.__data_cache[0] != mtime:
+            self.__data_cache = (mtime, self._load_from_file())
+        return self.__data_cache[1]
 
-        if 'min_salary' in criteria:
-            min_sal = criteria['min_salary']
-            vacancies = [v for v in vacancies if v.avg_salary >= min_sal]
+    def _salary_sorted_items(self) -> tuple:
+        """
+        Вернуть словари вакансий, отсортированные по средней зарплате, и
+        параллельный список зарплат для bisect. Индекс кэшируется и
+        пересобирается только когда файл хранилища изменился.
+        """
+        mtime = self._file_mtime()
+        if self.__salary_index is None or self.__salary_index[0] != mtime:
+            items = list(self._cached_data())
+            for item in items:
+                if 'avg_salary' not in item:
+                    item['avg_salary'] = _item_avg_salary(item)
+            items.sort(key=lambda item: item['avg_salary'])
+            salaries = [item['avg_salary'] for item in items]
+            self.__salary_index = (mtime, items, salaries)
 
-        return vacancies
+        return self.__salary_index[1], self.__salary_index[2]
 
     def delete_vacancies(self, **criteria) -> None:
         """Удалить вакансии по критериям"""
@@ -95,21 +221,148 @@ class JSONStorage(Storage):
     def clear_storage(self) -> None:
         """Очистить файл"""
         self._save_to_file([])
+        self.__data_cache = None
 
     def _load_from_file(self) -> List[dict]:
         """Загрузить данные из файла"""
+        return list(self._iter_from_file())
+
+    def _iter_from_file(self) -> Iterator[dict]:
+        """Потоковое чтение файла: словари отдаются по мере парсинга"""
         try:
-            with open(self.__filename, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-                if not content:
-                    return []
-                return json.loads(content)
+            with open(self.__filename, 'rb') as f:
+                # use_float: числа с точкой читаются как float, а не Decimal,
+                # чтобы сохранённый avg_salary сериализовался обратно без потерь
+                yield from ijson.items(f, 'item', use_float=True)
         except FileNotFoundError:
-            return []
-        except json.JSONDecodeError:
-            return []
+            return
+        except ijson.JSONError:
+            # Пустой или повреждённый файл
+            return
 
     def _save_to_file(self, data: List[dict]) -> None:
-        """Сохранить данные в файл"""
-        with open(self.__filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        """Сохранить данные в файл атомарно через временный файл"""
+        # Запись в temp + os.replace: прерывание посреди записи не
+        # уничтожит уже сохранённые вакансии. fsync сознательно не
+        # вызываем — долговечность на уровне БД здесь не требуется
+        tmp_filename = self.__filename + ".tmp"
+        try:
+            with open(tmp_filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            os.replace(tmp_filename, self.__filename)
+        except BaseException:
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
+            raise
+
+
+class JSONLStorage(Storage):
+    """
+    Хранилище вакансий в формате JSON Lines (одна вакансия на строку).
+
+    В отличие от JSONStorage, добавление вакансий — это дозапись строк в
+    конец файла: стоимость add_vacancies пропорциональна размеру батча,
+    а не всего накопленного архива.
+    """
+
+    def __init__(self, filename: str = None) -> None:
+        """
+        Инициализация JSONL-хранилища.
+        :param filename: Путь к JSONL-файлу. Если не указан — используется путь по умолчанию.
+        """
+        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.__filename = filename or os.path.join(base_dir, "data", "vacancies.jsonl")
+        # Ключи уже сохранённых вакансий; заполняется лениво при первом добавлении
+        self.__known_keys = None
+
+    @property
+    def filename(self) -> str:
+        """Путь к JSONL-файлу хранилища"""
+        return self.__filename
+
+    def add_vacancies(self, vacancies: List[Vacancy]) -> None:
+        """
+        Добавить вакансии в хранилище, пропуская дубликаты.
+        :param vacancies: Список объектов Vacancy для сохранения.
+        """
+        if self.__known_keys is None:
+            self.__known_keys = {_dedup_key(item) for item in self._load_from_file()}
+
+        new_lines = []
+        for vacancy in vacancies:
+            item = vacancy.to_dict()
+            key = _dedup_key(item)
+            if key not in self.__known_keys:
+                self.__known_keys.add(key)
+                item['avg_salary'] = vacancy.avg_salary
+                new_lines.append(orjson.dumps(item))
+
+        if new_lines:
+            with open(self.__filename, 'ab') as f:
+                f.write(b'\n'.join(new_lines) + b'\n')
+
+    def get_vacancies(self, **criteria) -> List[Vacancy]:
+        """
+        Получить список вакансий с возможной фильтрацией по ключевым словам и зарплате.
+        :param criteria: keyword: ключевое слово, min_salary: минимальная зарплата.
+        :return: Отфильтрованный список объектов Vacancy.
+        """
+        return list(self.iter_vacancies(**criteria))
+
+    def iter_vacancies(self, **criteria) -> Iterator[Vacancy]:
+        """
+        Ленивый аналог get_vacancies: вакансии читаются из файла и
+        конструируются по мере обхода итератора.
+        :param criteria: keyword: ключевое слово, min_salary: минимальная зарплата.
+        :return: Итератор подходящих объектов Vacancy.
+        """
+        return _iter_filtered(self._iter_from_file(), criteria)
+
+    def delete_vacancies(self, **criteria) -> None:
+        """Удалить вакансии по критериям"""
+        # Заглушка для будущей интеграции с БД
+        pass
+
+    def clear_storage(self) -> None:
+        """Очистить файл"""
+        with open(self.__filename, 'wb'):
+            pass
+        self.__known_keys = set()
+
+    def _load_from_file(self) -> List[dict]:
+        """Загрузить данные из файла"""
+        return list(self._iter_from_file())
+
+    def _iter_from_file(self) -> Iterator[dict]:
+        """Построчное чтение файла: одна строка — одна вакансия"""
+        try:
+            with open(self.__filename, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        yield orjson.loads(line)
+        except FileNotFoundError:
+            return
+        except orjson.JSONDecodeError:
+            return
+
+
+def migrate_legacy_json(jsonl: JSONLStorage = None, legacy: JSONStorage = None) -> JSONLStorage:
+    """
+    Одноразовый перенос накопленного vacancies.json в JSONL-хранилище.
+
+    Выполняется только когда JSONL-файла ещё нет: уже переключённые
+    установки перенос не оплачивают. Легаси-файл не удаляется —
+    откат на JSONStorage остаётся возможным.
+    :param jsonl: Целевое JSONL-хранилище. Если не указано — стандартное.
+    :param legacy: Старое JSON-хранилище. Если не указано — стандартное.
+    :return: JSONL-хранилище, готовое к работе.
+    """
+    jsonl = jsonl or JSONLStorage()
+    if not os.path.exists(jsonl.filename):
+        os.makedirs(os.path.dirname(jsonl.filename) or ".", exist_ok=True)
+        legacy = legacy or JSONStorage()
+        lines = [orjson.dumps(item) for item in legacy._iter_from_file()]
+        if lines:
+            with open(jsonl.filename, 'wb') as f:
+                f.write(b'\n'.join(lines) + b'\n')
+    return jsonl
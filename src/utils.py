@@ -1,16 +1,54 @@
+import heapq
+import sys
+from functools import lru_cache
+from operator import attrgetter
 from typing import List
 from src.api import HH
 from src.vacancy import Vacancy
-from src.storage import JSONStorage
+from src.storage import migrate_legacy_json
 
 
+# Сообщения циклов ввода; собраны один раз на модуль, а не на каждую итерацию
+_MSG_REQUIRED = "⚠️ Значение обязательно для заполнения!"
+_MSG_NOT_A_NUMBER = "⚠️ Введите корректное число!"
+
+# Шаблон карточки вакансии в списке; один разобранный %-шаблон
+# вместо пересборки f-строки из пяти кусков на каждую запись
+_VACANCY_BLOCK_TMPL = (
+    "\n%d. %s\n"
+    "   Зарплата: %s\n"
+    "   Ссылка: %s\n"
+    "   Описание: %s...\n"
+)
+
 class UserInterface:
     """
     Класс пользовательского интерфейса для работы с вакансиями через консоль.
     """
     def __init__(self) -> None:
         self.api = HH()
-        self.storage = JSONStorage()
+        # JSONL-хранилище: добавление вакансий — дозапись строк в конец
+        # файла, O(батча) вместо перезаписи всего архива; накопленный
+        # vacancies.json переносится один раз при первом запуске
+        self.storage = migrate_legacy_json()
+        # Кэш результатов поиска: повторный запрос с теми же параметрами
+        # в рамках сессии не ходит в сеть и не парсит JSON заново
+        self._cached_load = lru_cache(maxsize=32)(self._load_from_api)
+
+    def _load_from_api(self, keyword: str, max_pages: int, per_page: int,
+                       area: int | None, salary_from: int | None,
+                       salary_to: int | None) -> tuple:
+        """Запрос вакансий у API; результат мемоизируется в _cached_load"""
+        # Кортеж вместо списка: закэшированное значение нельзя случайно
+        # изменить у одного из потребителей
+        return tuple(self.api.load_vacancies(
+            keyword,
+            max_pages=max_pages,
+            per_page=per_page,
+            area=area,
+            salary_from=salary_from,
+            salary_to=salary_to
+        ))
 
     def run(self) -> None:
         """Главное меню программы"""
@@ -66,18 +104,18 @@ class UserInterface:
 
             print(f"🔍 Ищем вакансии по запросу '{keyword}'...")
 
-            # Получаем данные от API
-            raw_vacancies = self.api.load_vacancies(
+            # Получаем данные от API (или из кэша повторных запросов)
+            raw_vacancies = self._cached_load(
                 keyword,
-                max_pages=search_params['max_pages'],
-                per_page=search_params['per_page'],
-                area=search_params['area'],
-                salary_from=search_params['salary_from'],
-                salary_to=search_params['salary_to']
+                search_params['max_pages'],
+                search_params['per_page'],
+                search_params['area'],
+                search_params['salary_from'],
+                search_params['salary_to']
             )
 
-            # Преобразуем в объекты Vacancy
-            vacancies = [Vacancy.from_hh_dict(data) for data in raw_vacancies]
+            # Преобразуем в объекты Vacancy пакетно по быстрому пути
+            vacancies = Vacancy.from_hh_list(raw_vacancies)
 
             if vacancies:
                 # Сохраняем в файл
@@ -154,7 +192,7 @@ class UserInterface:
                     elif allow_none:
                         return None
                     else:
-                        print("⚠️ Значение обязательно для заполнения!")
+                        print(_MSG_REQUIRED)
                         continue
 
                 # Преобразование в число
@@ -172,7 +210,7 @@ class UserInterface:
                 return value
 
             except ValueError:
-                print("⚠️ Введите корректное число!")
+                print(_MSG_NOT_A_NUMBER)
 
     def _show_saved_vacancies(self) -> None:
         """Показать все сохраненные вакансии"""
@@ -190,8 +228,9 @@ class UserInterface:
             vacancies = self.storage.get_vacancies()
 
             if vacancies:
-                # Сортируем по убыванию зарплаты
-                top_vacancies = sorted(vacancies, reverse=True)[:n]
+                # Выбираем топ N по зарплате за O(N log n) вместо полной
+                # сортировки; attrgetter сравнивает готовые float напрямую
+                top_vacancies = heapq.nlargest(n, vacancies, key=attrgetter('avg_salary'))
                 print(f"\nТоп {n} вакансий по зарплате:")
                 self._display_vacancies(top_vacancies)
             else:
@@ -216,24 +255,19 @@ class UserInterface:
         confirm = input("Вы уверены, что хотите удалить все вакансии? (да/нет): ")
         if confirm.lower() in ['да', 'yes', 'y']:
             self.storage.clear_storage()
+            self._cached_load.cache_clear()
             print("Все вакансии удалены")
 
     def _display_vacancies(self, vacancies: List[Vacancy]) -> None:
         """Отобразить список вакансий"""
-        for i, vacancy in enumerate(vacancies, 1):
-            salary_info = self._format_salary(vacancy)
-            print(f"\n{i}. {vacancy.title}")
-            print(f"   Зарплата: {salary_info}")
-            print(f"   Ссылка: {vacancy.url}")
-            print(f"   Описание: {vacancy.description[:100]}...")
+        # Вывод собирается целиком и пишется одним вызовом: одна блокировка
+        # stdout и один syscall вместо четырёх print на каждую вакансию
+        sys.stdout.write("".join(
+            _VACANCY_BLOCK_TMPL % (i, v.title, self._format_salary(v), v.url, v.description_preview)
+            for i, v in enumerate(vacancies, 1)
+        ))
 
     def _format_salary(self, vacancy: Vacancy) -> str:
         """Форматирование зарплаты для отображения"""
-        if vacancy.salary_from > 0 and vacancy.salary_to > 0:
-            return f"{vacancy.salary_from} - {vacancy.salary_to} {vacancy.currency}"
-        elif vacancy.salary_from > 0:
-            return f"от {vacancy.salary_from} {vacancy.currency}"
-        elif vacancy.salary_to > 0:
-            return f"до {vacancy.salary_to} {vacancy.currency}"
-        else:
-            return "Не указана"
+        # Табличный выбор формата живёт в Vacancy рядом с маской зарплаты
+        return vacancy.format_salary()
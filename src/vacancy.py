@@ -1,5 +1,75 @@
+import sys
+
+# Канонические значения по умолчанию; sys.intern гарантирует один общий
+# строковый объект на все записи с незаполненными полями вместо тысяч копий
+_DEFAULT_TITLE = sys.intern("Название не указано")
+_DEFAULT_CURRENCY = sys.intern("RUB")
+_DEFAULT_DESCRIPTION = sys.intern("Описание не указано")
+_DEFAULT_REQUIREMENTS = sys.intern("Требования не указаны")
+
+
+def _validate_title(title: str) -> str:
+    """Валидация названия вакансии"""
+    if not title or not isinstance(title, str):
+        return _DEFAULT_TITLE
+    return title.strip()
+
+
+def _validate_url(url: str) -> str:
+    """Валидация URL вакансии"""
+    if not url or not isinstance(url, str):
+        return ""
+    return url.strip()
+
+
+def _validate_currency(currency: str | None) -> str:
+    """Валидация валюты зарплаты"""
+    if not currency:
+        return _DEFAULT_CURRENCY
+    if isinstance(currency, str):
+        # Код валюты короткий и повторяется в каждой записи — интернируем
+        return sys.intern(currency)
+    # Нестроковое значение (например, из отредактированного вручную файла):
+    # sys.intern на нём упал бы с TypeError
+    return str(currency)
+
+
+def _validate_salary(salary: int | float | str | None) -> int:
+    """Валидация зарплаты"""
+    if salary is None or salary == "":
+        return 0
+    try:
+        return int(float(salary))  # Обрабатывает int, float и строки
+    except (ValueError, TypeError):
+        return 0
+
+
+# Публичные поля, попадающие в to_dict; замороженный кортеж переиспользуется
+# всеми вызовами вместо пересборки литерала словаря с нуля
+_PUB_KEYS = ("title", "url", "salary_from", "salary_to", "currency", "description", "requirements")
+
+# Таблица форматов format_salary, индексируемая 2-битной маской наличия
+# зарплаты: бит 0 — есть нижняя граница, бит 1 — есть верхняя
+_SALARY_FMT = (
+    lambda v: "Не указана",
+    lambda v: f"от {v.salary_from} {v.currency}",
+    lambda v: f"до {v.salary_to} {v.currency}",
+    lambda v: f"{v.salary_from} - {v.salary_to} {v.currency}",
+)
+
+# Таблица форматов __str__, индексируемая 2-битной маской наличия зарплаты:
+# бит 0 — есть нижняя граница, бит 1 — есть верхняя
+_VACANCY_STR_FMT = (
+    lambda v: f"{v.title} | Зарплата не указана",
+    lambda v: f"{v.title} | {v.salary_from}-{v.salary_to} {v.currency}",
+    lambda v: f"{v.title} | {v.salary_from}-{v.salary_to} {v.currency}",
+    lambda v: f"{v.title} | {v.salary_from}-{v.salary_to} {v.currency}",
+)
+
+
 class Vacancy:
-    __slots__ = ("title", "url", "salary_from", "salary_to", "currency", "description", "requirements")
+    __slots__ = ("title", "url", "salary_from", "salary_to", "currency", "description", "requirements",
+                 "avg_salary", "description_preview", "_sal_mask")
     def __init__(
         self,
         title: str, # title (str): Название вакансии.
@@ -12,34 +82,22 @@ class Vacancy:
         **kwargs
     ) -> None:
 
-        self.title = self._validate_title(title)
-        self.url = self._validate_url(url)
-        self.salary_from = self._validate_salary(salary_from)
-        self.salary_to = self._validate_salary(salary_to)
-        self.currency = currency or "RUB"
-        self.description = description or "Описание не указано"
-        self.requirements = requirements or "Требования не указаны"
-
-    def _validate_title(self, title:str) -> str:
-        """Валидация названия вакансии"""
-        if not title or not isinstance(title, str):
-            return "Название не указано"
-        return title.strip()
-
-    def _validate_url(self, url:str) -> str:
-        """Валидация URL вакансии"""
-        if not url or not isinstance(url, str):
-            return ""
-        return url.strip()
-
-    def _validate_salary(self, salary: int | float | str | None) -> int:
-        """Валидация зарплаты"""
-        if salary is None or salary == "":
-            return 0
-        try:
-            return int(float(salary))  # Обрабатывает int, float и строки
-        except (ValueError, TypeError):
-            return 0
+        # Валидаторы — функции уровня модуля: без создания связанных
+        # методов на каждый из сотен конструируемых объектов
+        self.title = _validate_title(title)
+        self.url = _validate_url(url)
+        self.salary_from = _validate_salary(salary_from)
+        self.salary_to = _validate_salary(salary_to)
+        self.currency = _validate_currency(currency)
+        self.description = description or _DEFAULT_DESCRIPTION
+        self.requirements = requirements or _DEFAULT_REQUIREMENTS
+        # Превью для списков режется один раз, а не при каждом показе
+        self.description_preview = self.description[:100]
+        # Средняя зарплата считается один раз здесь: сортировки и фильтры
+        # дальше сравнивают готовый float, а не проходят ветвления свойства
+        self.avg_salary = self._compute_avg_salary()
+        # Маска наличия границ зарплаты для табличного выбора формата
+        self._sal_mask = (self.salary_from > 0) | ((self.salary_to > 0) << 1)
 
     def __lt__(self, other: object) -> bool:
         """Сравнение по зарплате для сортировки"""
@@ -47,8 +105,7 @@ class Vacancy:
             return NotImplemented
         return self.avg_salary < other.avg_salary
 
-    @property
-    def avg_salary(self) -> float:
+    def _compute_avg_salary(self) -> float:
         """Средняя зарплата для сравнения"""
         if self.salary_from > 0 and self.salary_to > 0:
             return (self.salary_from + self.salary_to) / 2
@@ -61,7 +118,9 @@ class Vacancy:
     @classmethod
     def from_hh_dict(cls, data: dict) -> "Vacancy":
         """Создание объекта Vacancy из словаря, полученного от HH API"""
-        if not isinstance(data, dict):
+        # HH всегда отдаёт словари; под python -O страховочная проверка
+        # типа вырезается из горячего пути вместе с веткой
+        if __debug__ and not isinstance(data, dict):
             raise ValueError("Данные должны быть словарем")
 
         salary = data.get('salary') or {}
@@ -77,22 +136,54 @@ class Vacancy:
             requirements=snippet.get('requirement', '')
         )
 
+    @classmethod
+    def _from_hh_fast(cls, data: dict) -> "Vacancy":
+        """Быстрое создание Vacancy из словаря HH API в обход __init__.
+
+        HH отдаёт предсказуемые типы (name — строка, salary.from — число
+        или None), поэтому полный цикл валидации не нужен: объект
+        создаётся через object.__new__ и прямое заполнение слотов.
+        """
+        vacancy = object.__new__(cls)
+        salary = data.get('salary') or {}
+        snippet = data.get('snippet') or {}
+
+        vacancy.title = (data.get('name') or '').strip() or _DEFAULT_TITLE
+        vacancy.url = (data.get('alternate_url') or '').strip()
+        salary_from = salary.get('from')
+        salary_to = salary.get('to')
+        vacancy.salary_from = int(salary_from) if salary_from else 0
+        vacancy.salary_to = int(salary_to) if salary_to else 0
+        currency = salary.get('currency')
+        vacancy.currency = sys.intern(currency) if currency else _DEFAULT_CURRENCY
+        vacancy.description = snippet.get('responsibility') or _DEFAULT_DESCRIPTION
+        vacancy.requirements = snippet.get('requirement') or _DEFAULT_REQUIREMENTS
+        vacancy.description_preview = vacancy.description[:100]
+        vacancy.avg_salary = vacancy._compute_avg_salary()
+        vacancy._sal_mask = (vacancy.salary_from > 0) | ((vacancy.salary_to > 0) << 1)
+        return vacancy
+
+    @classmethod
+    def from_hh_list(cls, items: list) -> list["Vacancy"]:
+        """Пакетное создание вакансий из списка словарей HH API"""
+        fast = cls._from_hh_fast
+        return [fast(item) for item in items]
+
     def to_dict(self) -> dict:
         """Преобразование объекта Vacancy в словарь"""
-        return {
-            'title': self.title,
-            'url': self.url,
-            'salary_from': self.salary_from,
-            'salary_to': self.salary_to,
-            'currency': self.currency,
-            'description': self.description,
-            'requirements': self.requirements
-        }
+        return dict(zip(_PUB_KEYS, (
+            self.title, self.url, self.salary_from, self.salary_to,
+            self.currency, self.description, self.requirements
+        )))
+
+    def format_salary(self) -> str:
+        """Строка зарплаты для отображения пользователю"""
+        # Выбор формата по готовой маске — один индекс вместо трёх сравнений
+        return _SALARY_FMT[self._sal_mask](self)
 
     def __str__(self) -> str:
         """Возвращает строковое представление вакансии для пользователя"""
-        salary_str = f"{self.salary_from}-{self.salary_to} {self.currency}" if self.salary_from or self.salary_to else "Зарплата не указана"
-        return f"{self.title} | {salary_str}"
+        return _VACANCY_STR_FMT[self._sal_mask](self)
 
     def __repr__(self) -> str:
         """Возвращает строковое представление для отладки"""
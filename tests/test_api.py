@@ -1,13 +1,17 @@
+import asyncio
+import httpx
 import pytest
+import orjson
 import requests
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 from src.api import HH, ConnectionError, ParserError
 
 
 @pytest.fixture
 def hh_instance():
     """Фикстура: возвращает экземпляр HH с таймаутом и ретраями"""
-    return HH(timeout=1, max_retries=1)
+    # prewarm=False: тесты не должны ходить в настоящий API
+    return HH(timeout=1, max_retries=1, prewarm=False)
 
 
 def test_connect_success(hh_instance):
@@ -46,7 +50,7 @@ def test_load_vacancies_success(hh_instance):
             patch.object(hh_instance._session, 'get') as mock_get:
         mock_response = MagicMock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = sample_data
+        mock_response.content = orjson.dumps(sample_data)
         mock_get.return_value = mock_response
 
         result = hh_instance.load_vacancies("Python")
@@ -65,7 +69,7 @@ def test_load_vacancies_no_items(hh_instance):
             patch.object(hh_instance._session, 'get') as mock_get:
         mock_response = MagicMock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = sample_data
+        mock_response.content = orjson.dumps(sample_data)
         mock_get.return_value = mock_response
 
         result = hh_instance.load_vacancies("Python")
@@ -78,3 +82,80 @@ def test_load_vacancies_api_failure(hh_instance):
             patch.object(hh_instance._session, 'get', side_effect=requests.exceptions.RequestException("API failed")):
         with pytest.raises(ParserError):
             hh_instance.load_vacancies("Python")
+
+
+def test_load_vacancies_invalid_json(hh_instance):
+    """Тест битого тела ответа: ошибка парсинга оборачивается в ParserError"""
+    with patch.object(hh_instance._session, 'get') as mock_get:
+        mock_response = MagicMock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.content = b"<html>Bad Gateway</html>"
+        mock_get.return_value = mock_response
+
+        with pytest.raises(ParserError):
+            hh_instance.load_vacancies("Python")
+
+
+def test_load_vacancies_keyword_list(hh_instance):
+    """Тест объединения списка ключевых слов через OR"""
+    sample_data = {
+        "items": [{"id": "1", "name": "Python Developer"}],
+        "pages": 1
+    }
+
+    with patch.object(hh_instance._session, 'get') as mock_get:
+        mock_response = MagicMock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.content = orjson.dumps(sample_data)
+        mock_get.return_value = mock_response
+
+        hh_instance.load_vacancies(["Python", "Java"])
+        sent_params = mock_get.call_args.kwargs["params"]
+        assert sent_params["text"] == "Python OR Java"
+
+
+def test_load_vacancies_multiple_pages(hh_instance):
+    """Тест параллельной догрузки страниц после первой"""
+    first_page = {
+        "items": [{"id": "p0", "name": "Dev 0"}],
+        "pages": 3,
+        "found": 250
+    }
+    page_items = {
+        1: [{"id": "p1", "name": "Dev 1"}],
+        2: [{"id": "p2", "name": "Dev 2"}],
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        return httpx.Response(200, content=orjson.dumps({"items": page_items[page]}))
+
+    with patch.object(hh_instance, '_async_transport', return_value=httpx.MockTransport(handler)), \
+            patch.object(hh_instance._session, 'get') as mock_get:
+        mock_response = MagicMock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.content = orjson.dumps(first_page)
+        mock_get.return_value = mock_response
+
+        result = hh_instance.load_vacancies("Python", max_pages=3)
+
+    assert [item["id"] for item in result] == ["p0", "p1", "p2"]
+
+
+def test_afetch_pages_retries_transient_status(hh_instance):
+    """Тест повтора запроса страницы после транзиентного 502"""
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(str(request.url))
+        if len(attempts) == 1:
+            return httpx.Response(502)
+        return httpx.Response(200, content=orjson.dumps({"items": [{"id": "p1"}]}))
+
+    params = {**hh_instance.BASE_PARAMS, "text": "Python"}
+    with patch.object(hh_instance, '_async_transport', return_value=httpx.MockTransport(handler)), \
+            patch('asyncio.sleep', new=AsyncMock()):
+        result = asyncio.run(hh_instance._afetch_pages(params, range(1, 2)))
+
+    assert len(attempts) == 2
+    assert result[0]["id"] == "p1"
@@ -2,7 +2,7 @@ import os
 import tempfile
 import pytest
 import json
-from src.storage import JSONStorage
+from src.storage import JSONStorage, JSONLStorage, migrate_legacy_json
 from src.vacancy import Vacancy
 
 
@@ -68,3 +68,43 @@ def test_save_and_manual_load(temp_json_storage):
     with open(temp_json_storage.filename, encoding='utf-8') as f:
         loaded = json.load(f)
     assert loaded[0]["title"] == "Manual QA"
+
+
+@pytest.fixture
+def temp_jsonl_storage():
+    """Создаёт временный файл для JSONL-хранилища"""
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".jsonl") as tmp:
+        storage = JSONLStorage(filename=tmp.name)
+        yield storage
+        os.remove(tmp.name)
+
+
+def test_jsonl_add_and_get_vacancies(temp_jsonl_storage, sample_vacancies):
+    temp_jsonl_storage.add_vacancies(sample_vacancies)
+    result = temp_jsonl_storage.get_vacancies()
+    assert len(result) == 2
+    assert result[0].title == "Python Dev"
+
+
+def test_jsonl_add_skips_duplicates(temp_jsonl_storage, sample_vacancies):
+    temp_jsonl_storage.add_vacancies(sample_vacancies)
+    temp_jsonl_storage.add_vacancies(sample_vacancies)
+    assert len(temp_jsonl_storage.get_vacancies()) == 2
+
+
+def test_jsonl_clear_storage(temp_jsonl_storage, sample_vacancies):
+    temp_jsonl_storage.add_vacancies(sample_vacancies)
+    temp_jsonl_storage.clear_storage()
+    assert temp_jsonl_storage.get_vacancies() == []
+
+
+def test_migrate_legacy_json(temp_json_storage, sample_vacancies, tmp_path):
+    temp_json_storage.add_vacancies(sample_vacancies)
+    jsonl = JSONLStorage(filename=str(tmp_path / "vacancies.jsonl"))
+
+    migrated = migrate_legacy_json(jsonl=jsonl, legacy=temp_json_storage)
+    assert len(migrated.get_vacancies()) == 2
+
+    # Повторный вызов не переносит и не дублирует записи
+    migrate_legacy_json(jsonl=jsonl, legacy=temp_json_storage)
+    assert len(jsonl.get_vacancies()) == 2
@@ -1,12 +1,16 @@
 import pytest
 from unittest.mock import MagicMock
+from src.api import HH
 from src.utils import UserInterface
 from src.vacancy import Vacancy
 
 
 @pytest.fixture
-def ui():
+def ui(monkeypatch):
     """Создаёт объект UserInterface с подменёнными API и хранилищем"""
+    # UserInterface создаёт настоящий HH — глушим фоновый прогрев,
+    # чтобы тесты не ходили в настоящий API
+    monkeypatch.setattr(HH, "_prewarm_connection", lambda self: None)
     ui = UserInterface()
     ui.api = MagicMock()
     ui.storage = MagicMock()
@@ -33,6 +33,17 @@ def test_validate_url(url, expected):
     assert v.url == expected
 
 
+@pytest.mark.parametrize("currency,expected", [
+    (None, "RUB"),
+    ("", "RUB"),
+    ("USD", "USD"),
+    (1, "1"),
+])
+def test_validate_currency(currency, expected):
+    v = Vacancy("Title", "url", currency=currency)
+    assert v.currency == expected
+
+
 @pytest.mark.parametrize("salary_input,expected", [
     (None, 0),
     ("", 0),
@@ -93,3 +104,27 @@ def test_str_and_repr():
     v = Vacancy("QA", "url", 50000, 100000, "RUB")
     assert str(v) == "QA | 50000-100000 RUB"
     assert "Vacancy(title='QA'" in repr(v)
+
+
+def test_from_hh_list_fast_path():
+    data = {
+        "name": "Python Dev",
+        "alternate_url": "https://hh.ru/vac1",
+        "salary": {"from": 100000, "to": 150000, "currency": "RUB"},
+        "snippet": {"responsibility": "write code", "requirement": "know Python"}
+    }
+    vacancies = Vacancy.from_hh_list([data, data])
+    assert len(vacancies) == 2
+    v = vacancies[0]
+    assert v.title == "Python Dev"
+    assert v.salary_from == 100000
+    assert v.avg_salary == 125000.0
+    assert v.requirements == "know Python"
+
+
+def test_from_hh_list_defaults():
+    vacancies = Vacancy.from_hh_list([{"name": "", "salary": None, "snippet": None}])
+    v = vacancies[0]
+    assert v.title == "Название не указано"
+    assert v.salary_from == 0
+    assert v.currency == "RUB"